@@ -3,5 +3,6 @@ __all__ = [
     'page_misinformation_checker',
     'page2',
     'evidence_context',
+    'components',
     'db_utils'
 ]
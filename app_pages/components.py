@@ -0,0 +1,28 @@
+import threading
+import streamlit as st
+from backend import RealFactChecker, RealOriginTracer, RealSocialMonitor, ViralTracker
+
+class _LazyComponents(dict):
+    # Each component is only constructed the first time a page asks for it
+    _factories = {
+        'social_monitor': RealSocialMonitor,
+        'fact_checker': RealFactChecker,
+        'viral_tracker': ViralTracker,
+        'origin_tracer': RealOriginTracer
+    }
+
+    def __init__(self):
+        super().__init__()
+        # Every session shares this dict through st.cache_resource
+        self._lock = threading.Lock()
+
+    def __missing__(self, key):
+        with self._lock:
+            # Another session may have built it while this one waited for the lock
+            if key not in self:
+                self[key] = self._factories[key]()
+            return self[key]
+
+@st.cache_resource
+def get_components():
+    return _LazyComponents()
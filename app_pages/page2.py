@@ -1,10 +1,7 @@
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
-import requests
 import time
 
 def render():
@@ -181,6 +178,7 @@ def analyze_profile_legitimacy(profile_data, deep_scan):
 
 def detect_coordinated_campaigns(handle):
     campaigns = []
+    detected_date = datetime.now().strftime("%Y-%m-%d")
     
 
     if random.random() < 0.3:  
@@ -191,7 +189,7 @@ def detect_coordinated_campaigns(handle):
             "activity_pattern": "Synchronized posting every 2-3 hours",
             "content_similarity": 0.87,
             "risk_level": "High",
-            "detected_date": datetime.now().strftime("%Y-%m-%d"),
+            "detected_date": detected_date,
             "description": "Multiple accounts impersonating the VIP with similar content patterns"
         })
 
@@ -203,7 +201,7 @@ def detect_coordinated_campaigns(handle):
             "activity_pattern": "Burst posting during peak hours",
             "content_similarity": 0.73,
             "risk_level": "Medium",
-            "detected_date": datetime.now().strftime("%Y-%m-%d"),
+            "detected_date": detected_date,
             "description": "Coordinated negative content targeting the VIP"
         })
     
@@ -1,24 +1,30 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from backend.social_monitor import RealSocialMonitor
-from backend.fact_checker import RealFactChecker
-from backend.viral_tracker import ViralTracker
-from backend.origin_tracer import RealOriginTracer
-from datetime import datetime
-import os
+from app_pages.components import get_components
 
-@st.cache_resource
-def load_components():
-    return {
-        'social_monitor': RealSocialMonitor(),
-        'fact_checker': RealFactChecker(),
-        'viral_tracker': ViralTracker(),
-        'origin_tracer': RealOriginTracer()
-    }
+# Scores below 0.5 are low risk, below 0.7 medium, anything else high
+RISK_THRESHOLDS = np.array([0.5, 0.7])
+RISK_LEVELS = [("🟢", "LOW RISK"), ("🟡", "MEDIUM RISK"), ("🔴", "HIGH RISK")]
+
+def risk_buckets(scores):
+    return np.searchsorted(RISK_THRESHOLDS, scores, side='right')
+
+def render_summary_metrics(risk_counts, total_engagement):
+    low_risk, medium_risk, high_risk = risk_counts
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🔴 High Risk", int(high_risk))
+    with col2:
+        st.metric("🟡 Medium Risk", int(medium_risk))
+    with col3:
+        st.metric("🟢 Low Risk", int(low_risk))
+    with col4:
+        st.metric("Total Engagement", f"{total_engagement:,}")
 
 def render():
     st.title("🔍 Real-Time VIP Misinformation Detection")
+    components = get_components()
     
     # User input for VIP name
     vip_input = st.text_input("Enter VIP name or handle:", "@elonmusk", help="Enter any VIP handle or name to search for")
@@ -33,8 +39,6 @@ def render():
         if not vip_input.strip():
             st.error("Please enter a VIP name or handle")
             return
-            
-        components = load_components()
         
         with st.spinner(f"Scanning content about {vip_input}..."):
             # Get posts
@@ -47,64 +51,43 @@ def render():
                 st.warning("No posts found meeting your criteria. Try lowering the engagement threshold.")
                 return
             
-            # Analyze posts
-            analyzed_posts = []
-            analysis_progress = st.progress(0)
-            
-            for i, post in enumerate(filtered_posts):
-                content = post.get('content', '') or post.get('title', '')
-                if content:
-                    analysis = components['fact_checker'].analyze_real_content(content)
-                    post['misinformation_score'] = analysis['misinformation_probability']
-                    post['verdict'] = analysis['verdict']
-                    post['flags'] = analysis.get('flags', [])
-                else:
-                    post['misinformation_score'] = 0.5
-                    post['verdict'] = 'No Content'
-                    post['flags'] = []
-                
-                analyzed_posts.append(post)
-                analysis_progress.progress((i + 1) / len(filtered_posts))
+            # Score every post in one analyze_frame call
+            contents = [post.get('content', '') or post.get('title', '') for post in filtered_posts]
+            has_content = np.array([bool(content) for content in contents])
+            analyses = components['fact_checker'].analyze_frame(pd.DataFrame({'content': contents}), 'content')
+
+            meta = pd.DataFrame.from_records(filtered_posts)
+            meta['verdict'] = analyses['verdict'].where(has_content, 'No Content')
+            meta['flags'] = [flags if ok else [] for flags, ok in zip(analyses['flags'], has_content)]
+            meta['ml_prediction'] = analyses['ml_prediction'].where(has_content, 0.5)
+            scores = np.where(has_content, analyses['misinformation_score'].to_numpy(), 0.5)
+            engagements = np.array([post.get('engagement', 0) for post in filtered_posts], dtype=np.int64)
+            risk_counts = np.bincount(risk_buckets(scores), minlength=len(RISK_LEVELS))
             
-            # Store in session state
-            st.session_state.analyzed_posts = sorted(analyzed_posts, key=lambda x: x['misinformation_score'], reverse=True)
+            # Store columns once, highest risk first, so reruns only slice arrays
+            order = np.argsort(-scores, kind='stable')
+            st.session_state.scores = scores[order]
+            st.session_state.engagements = engagements[order]
+            st.session_state.summary = (tuple(int(count) for count in risk_counts), int(engagements.sum()))
+            st.session_state.meta = meta.iloc[order].reset_index(drop=True)
             
-            st.success(f"✅ Analyzed {len(analyzed_posts)} posts")
+            st.success(f"✅ Analyzed {len(filtered_posts)} posts")
     
     # Display results
-    if 'analyzed_posts' in st.session_state and st.session_state.analyzed_posts:
-        posts = st.session_state.analyzed_posts
+    if 'scores' in st.session_state and len(st.session_state.scores):
+        scores = st.session_state.scores
+        engagements = st.session_state.engagements
         
-        # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            high_risk = len([p for p in posts if p['misinformation_score'] >= 0.7])
-            st.metric("🔴 High Risk", high_risk)
-        with col2:
-            medium_risk = len([p for p in posts if 0.5 <= p['misinformation_score'] < 0.7])
-            st.metric("🟡 Medium Risk", medium_risk)
-        with col3:
-            low_risk = len([p for p in posts if p['misinformation_score'] < 0.5])
-            st.metric("🟢 Low Risk", low_risk)
-        with col4:
-            total_engagement = sum(p.get('engagement', 0) for p in posts)
-            st.metric("Total Engagement", f"{total_engagement:,}")
+        render_summary_metrics(*st.session_state.summary)
         
         # Show individual posts
         st.subheader("📊 Analyzed Posts")
         
-        for i, post in enumerate(posts[:20]):  # Show top 20
-            risk_score = post['misinformation_score']
-            
-            if risk_score >= 0.7:
-                risk_emoji = "🔴"
-                risk_text = "HIGH RISK"
-            elif risk_score >= 0.5:
-                risk_emoji = "🟡" 
-                risk_text = "MEDIUM RISK"
-            else:
-                risk_emoji = "🟢"
-                risk_text = "LOW RISK"
+        top = slice(0, 20)  # Show top 20
+        for post, risk_score, engagement, bucket in zip(
+            st.session_state.meta.iloc[top].to_dict('records'), scores[top], engagements[top], risk_buckets(scores[top])
+        ):
+            risk_emoji, risk_text = RISK_LEVELS[bucket]
             
             with st.expander(f"{risk_emoji} {risk_text} - {post['platform']} ({risk_score:.1%})"):
                 col1, col2 = st.columns([2, 1])
@@ -123,7 +106,10 @@ def render():
                 
                 with col2:
                     st.metric("Risk Score", f"{risk_score:.1%}")
-                    st.metric("Engagement", f"{post.get('engagement', 0):,}")
+                    st.metric("Engagement", f"{engagement:,}")
+                    
+                    if components['fact_checker'].classifier is not None:
+                        st.metric("ML Prediction", f"{post['ml_prediction']:.1%}")
                     
                     if post.get('url'):
                         st.markdown(f"[🔗 View Original]({post['url']})")
@@ -136,7 +122,6 @@ def render():
         if st.button("🕵️ Trace Origin"):
             if trace_content:
                 with st.spinner("Tracing origin..."):
-                    components = load_components()
                     result = components['origin_tracer'].trace_rumor_origin(trace_content)
                     
                     st.write("**Origin Trace Results:**")
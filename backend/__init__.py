@@ -1,6 +1,6 @@
 from backend.fact_checker import RealFactChecker
 from backend.social_monitor import RealSocialMonitor
 from backend.viral_tracker import ViralTracker
-from backend.origin_tracer import OriginTracer
+from backend.origin_tracer import OriginTracer, RealOriginTracer
 
-__all__ = ['FactChecker', 'SocialMonitor', 'ViralTracker', 'OriginTracer']
+__all__ = ['RealFactChecker', 'RealSocialMonitor', 'ViralTracker', 'OriginTracer', 'RealOriginTracer']
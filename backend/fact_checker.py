@@ -1,27 +1,105 @@
 import os
-import re
-import requests
+import numpy as np
+import pandas as pd
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+TextScan = namedtuple('TextScan', [
+    's_count', 'c_count', 'bang_count', 'upper_count', 'word_count', 'length', 'sensational', 'unverified'
+])
+
+SUSPICIOUS_TERMS = frozenset({'breaking', 'exclusive', 'leaked', 'allegedly', 'unconfirmed', 'reportedly', 'scandal'})
+CREDIBLE_TERMS = frozenset({'according to', 'confirmed', 'verified', 'research', 'study shows'})
+SENSATIONAL_TERMS = frozenset({'breaking', 'exclusive', 'leaked'})
+UNVERIFIED_TERMS = frozenset({'allegedly', 'reportedly'})
+
+# translate() deletes every byte in here, leaving only the ASCII capitals A-Z
+_NOT_ASCII_UPPER = bytes(c for c in range(256) if not 65 <= c <= 90)
+
+VERDICTS = np.array([
+    "Verified - Highly Credible",
+    "Low Risk - Likely Accurate",
+    "Medium Risk - Uncertain",
+    "Medium-High Risk - Needs Verification",
+    "High Risk - Likely Misinformation"
+])
+VERDICT_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8])
+FLAG_NAMES = ('Sensational', 'Unverified', 'Excessive !', 'Excessive CAPS')
+# Flag list for every bitmask value, bit i set meaning FLAG_NAMES[i] applies
+_FLAG_SETS = [tuple(name for i, name in enumerate(FLAG_NAMES) if bits >> i & 1) for bits in range(1 << len(FLAG_NAMES))]
+
+# Texts shorter than this (emoji, one-word replies) get the neutral result without a scan
+MIN_ANALYZABLE_LENGTH = 8
+NEUTRAL_SCORE = 0.4
+_NEUTRAL_SCORING = (NEUTRAL_SCORE, "Medium Risk - Uncertain", ())
+
+def _score_kernel(s_count, c_count, bang_count, upper_count, word_count, length, sensational, unverified):
+    # Scores, verdict indices and flag bitmasks for a whole batch of per-post counts
+    analyzable = length >= MIN_ANALYZABLE_LENGTH
+    total = np.maximum(word_count, 1)
+    scores = np.where(analyzable, np.clip((s_count - c_count) / (total / 10) + NEUTRAL_SCORE, 0, 1.0), NEUTRAL_SCORE)
+    verdict_idx = np.searchsorted(VERDICT_THRESHOLDS, scores, side='right')
+    flag_bits = (
+        sensational.astype(np.uint8)
+        | unverified.astype(np.uint8) << 1
+        | (bang_count > 3).astype(np.uint8) << 2
+        | (upper_count > length * 0.3).astype(np.uint8) << 3
+    ) * analyzable.astype(np.uint8)
+    return scores, verdict_idx, flag_bits
+
+def _score_scans(scans):
+    # One column per TextScan field, in field order, one row per text
+    columns = np.array(scans, dtype=np.int64).reshape(-1, len(TextScan._fields)).T
+    return _score_kernel(*columns)
+
+@lru_cache(maxsize=10000)
+def _scan(text):
+    # Everything the score and the flags need, gathered in one go; memoized per text so
+    # reposted content and reruns over the same posts skip the scan in both scoring paths
+    text_lower = text.lower()
+    # Distinct terms present; a C-level substring check per term is exact even when
+    # terms overlap ("scandallegedly") and beats a regex pass on post-sized texts
+    suspicious = {term for term in SUSPICIOUS_TERMS if term in text_lower}
+    return TextScan(
+        s_count=len(suspicious),
+        c_count=sum(term in text_lower for term in CREDIBLE_TERMS),
+        bang_count=text.count('!'),
+        upper_count=len(text.encode('ascii', 'ignore').translate(None, _NOT_ASCII_UPPER)),
+        word_count=text.count(' ') + 1 if text else 0,
+        length=len(text),
+        sensational=not suspicious.isdisjoint(SENSATIONAL_TERMS),
+        unverified=not suspicious.isdisjoint(UNVERIFIED_TERMS)
+    )
+
+@lru_cache(maxsize=10000)
+def _score_text(text):
+    # Single texts also skip the kernel on a repeat; the tuple is immutable, so a hit is shared
+    scores, verdict_idx, flag_bits = _score_scans([_scan(text)])
+    return float(scores[0]), str(VERDICTS[verdict_idx[0]]), _FLAG_SETS[flag_bits[0]]
+
 class RealFactChecker:
     def __init__(self):
         self.classifier = None
-        # Skip the transformers import to avoid torch issues
+        # Skip the transformers import to avoid torch issues; an optional model is
+        # only loaded the first time an ML prediction is requested
+        self.model_name = os.getenv('FACT_CHECK_MODEL')
+        # Label the model uses for misinformation; its score is the ml_prediction
+        self.fake_label = os.getenv('FACT_CHECK_FAKE_LABEL', 'FAKE').upper()
+        self._model_load_attempted = False
         print("✅ Fact checker initialized - using rule-based analysis")
 
     def analyze_real_content(self, text):
         try:
-            if not text or not isinstance(text, str):
-                text = "No content provided"
-            
-            # Simple pattern-based scoring
-            content_score = self._analyze_content_patterns(text)
+            if not isinstance(text, str) or len(text) < MIN_ANALYZABLE_LENGTH:
+                content_score, verdict, flags = _NEUTRAL_SCORING
+            else:
+                # Simple pattern-based scoring, through the same kernel as analyze_frame
+                content_score, verdict, flags = _score_text(text)
             final_score = content_score
-            verdict = self._get_verdict(final_score)
-            flags = self._identify_warning_flags(text)
             
             return {
                 'misinformation_probability': final_score,
@@ -32,7 +110,7 @@ class RealFactChecker:
                     'ml_prediction': 0.5,  # Default
                     'google_fact_check': {'found': False}
                 },
-                'flags': flags,
+                'flags': list(flags),
                 'timestamp': datetime.now().isoformat()
             }
         except Exception:
@@ -49,41 +127,93 @@ class RealFactChecker:
                 'timestamp': datetime.now().isoformat()
             }
 
-    def _analyze_content_patterns(self, text):
+    def analyze_batch(self, texts):
+        # analyze_real_content's result for every text, scored in one analyze_frame call
+        texts = [text if isinstance(text, str) else '' for text in texts]
+        frame = self.analyze_frame(pd.DataFrame({'text': texts}), 'text')
+        timestamp = datetime.now().isoformat()
+        return [
+            {
+                'misinformation_probability': score,
+                'verdict': verdict,
+                'confidence': min(score * 1.1, 1.0),
+                'analysis': {
+                    'content_patterns': score,
+                    'ml_prediction': ml_score,
+                    'google_fact_check': {'found': False}
+                },
+                'flags': flags,
+                'timestamp': timestamp
+            }
+            for score, verdict, flags, ml_score in zip(
+                frame['misinformation_score'].tolist(), frame['verdict'].tolist(), frame['flags'], frame['ml_prediction'].tolist()
+            )
+        ]
+
+    def setup_models(self, model_name):
+        # Imported here so the rule-based path never pays for torch/transformers
         try:
-            text_lower = text.lower()
-            suspicious = ['breaking', 'exclusive', 'leaked', 'allegedly', 'unconfirmed', 'reportedly', 'scandal']
-            credible = ['according to', 'confirmed', 'verified', 'research', 'study shows']
-            s_count = sum(w in text_lower for w in suspicious)
-            c_count = sum(w in text_lower for w in credible)
-            total = len(text.split()) or 1
-            return min(max((s_count - c_count) / (total / 10) + 0.4, 0), 1.0)
-        except Exception:
-            return 0.5
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+        except ImportError as e:
+            print(f"❌ Classifier unavailable, staying rule-based: {e}")
+            return
 
-    def _get_verdict(self, s):
-        if s >= 0.8: return "High Risk - Likely Misinformation"
-        if s >= 0.6: return "Medium-High Risk - Needs Verification"
-        if s >= 0.4: return "Medium Risk - Uncertain"
-        if s >= 0.2: return "Low Risk - Likely Accurate"
-        return "Verified - Highly Credible"
+        try:
+            # Inference only: half precision on GPU, bfloat16 on CPU
+            if torch.cuda.is_available():
+                device, dtype = 0, torch.float16
+            else:
+                device, dtype = -1, torch.bfloat16
+
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(model_name, torch_dtype=dtype).eval()
+            labels = {label.upper() for label in model.config.id2label.values()}
+            if self.fake_label not in labels:
+                print(f"❌ Classifier {model_name} has no {self.fake_label} label ({', '.join(sorted(labels))}), staying rule-based")
+                return
+            self.classifier = pipeline('text-classification', model=model, tokenizer=tokenizer, device=device)
+            print(f"✅ Loaded classifier {model_name}")
+        except Exception as e:
+            print(f"❌ Classifier setup failed: {e}")
 
-    def _identify_warning_flags(self, text):
-        flags = []
+    def _get_ml_predictions(self, texts, batch_size=32):
+        if self.classifier is None and self.model_name and not self._model_load_attempted:
+            self._model_load_attempted = True
+            self.setup_models(self.model_name)
+        if self.classifier is None:
+            return [0.5] * len(texts)
         try:
-            t = text.lower()
-            if any(word in t for word in ['breaking', 'exclusive', 'leaked']):
-                flags.append('Sensational')
-            if any(word in t for word in ['allegedly', 'reportedly']):
-                flags.append('Unverified')
-            if text.count('!') > 3:
-                flags.append('Excessive !')
-            if len([c for c in text if c.isupper()]) > len(text) * 0.3:
-                flags.append('Excessive CAPS')
-        except Exception:
-            pass
-        return flags
+            import torch
+
+            # One pipeline call so the model sees padded batches instead of single texts
+            inputs = [text[:512] if isinstance(text, str) and text else "No content provided" for text in texts]
+            with torch.inference_mode():
+                predictions = self.classifier(inputs, batch_size=batch_size, truncation=True, top_k=None)
+            # Every label's score per text; take the fake label's, whichever label won
+            return [
+                next(label['score'] for label in prediction if label['label'].upper() == self.fake_label)
+                for prediction in predictions
+            ]
+        except Exception as e:
+            print(f"❌ ML prediction failed: {e}")
+            return [0.5] * len(texts)
+
+    def analyze_frame(self, df, text_col):
+        texts = df[text_col].fillna('').astype(str).replace('', 'No content provided')
+        # One scan per text, then a single kernel call for the whole frame; a pandas
+        # .str pass per statistic costs more than it saves at page-sized batches
+        scores, verdict_idx, flag_bits = _score_scans([_scan(text) for text in texts])
+
+        return pd.DataFrame({
+            'misinformation_score': scores,
+            'verdict': VERDICTS[verdict_idx],
+            'flags': [list(_FLAG_SETS[bits]) for bits in flag_bits.tolist()],
+            'ml_prediction': self._get_ml_predictions(texts.tolist())
+        }, index=df.index)
 
     # Legacy compatibility
     def analyze_misinformation(self, text):
+        if isinstance(text, list):
+            return self.analyze_batch(text)
         return self.analyze_real_content(text)
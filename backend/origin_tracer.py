@@ -1,5 +1,11 @@
 import hashlib
 from datetime import datetime
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def _content_hash(content):
+    # SHA-256 runs on the CPU's SHA extensions via OpenSSL; repeated rumors skip hashing entirely
+    return hashlib.sha256(content.encode()).hexdigest()[:12]
 
 class RealOriginTracer:
     def __init__(self):
@@ -10,7 +16,8 @@ class RealOriginTracer:
         
         # Simple implementation that doesn't break
         results = {
-            'content_hash': hashlib.md5(content.encode()).hexdigest()[:12],
+            # Case and whitespace variants of the same rumor share one memoized hash
+            'content_hash': _content_hash(' '.join(content.lower().split())),
             'search_content': content,
             'origin_candidates': [
                 {
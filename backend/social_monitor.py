@@ -1,15 +1,49 @@
+import heapq
 import os
+import re
+import threading
+import time
 import requests
 import praw
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from bs4 import BeautifulSoup
+from functools import partial
+from itertools import chain
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+# Tweet links are all that's needed from search result pages, so match them in the raw HTML
+_TW_URL = re.compile(r'https?://(?:[\w-]+\.)?twitter\.com/[^"\'<> ]+/status/\d+')
+# VIP handles get re-polled often; reuse a search result page for this long
+SCRAPE_CACHE_SECONDS = 300
+SCRAPE_CACHE_MAX_ENTRIES = 1024
+_SCRAPE_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+# Google scrapes retry failed connects only: a read timeout is not retried, and a 429/503
+# Retry-After is never slept on inside the adapter
+_SCRAPE_RETRY = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3, respect_retry_after_header=False)
+
+def _pooled_session(max_retries=0):
+    # Keep-alive connections sized for the concurrent scrapes
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 class RealSocialMonitor:
     def __init__(self):
         self.reddit = None
+        self._http = _pooled_session(_SCRAPE_RETRY)
+        # PRAW retries and rate-limits on its own, so its session gets no adapter retries
+        self._reddit_http = _pooled_session()
+        # Least recently used first; scrapes run on worker threads, hence the lock
+        self._scrape_cache = OrderedDict()
+        self._scrape_cache_lock = threading.Lock()
         self.setup_apis()
 
     def setup_apis(self):
@@ -22,7 +56,8 @@ class RealSocialMonitor:
                 self.reddit = praw.Reddit(
                     client_id=client_id,
                     client_secret=client_secret,
-                    user_agent=user_agent
+                    user_agent=user_agent,
+                    requestor_kwargs={'session': self._reddit_http}
                 )
                 print("✅ Reddit API connected")
             else:
@@ -31,50 +66,76 @@ class RealSocialMonitor:
             print(f"❌ Reddit setup failed: {e}")
 
     def get_real_vip_content(self, vip_accounts, max_results=100):
-        all_posts = []
+        if not vip_accounts:
+            return []
         
-        for vip in vip_accounts:
-            # Scrape Twitter via web search
-            twitter_posts = self._scrape_twitter_web(vip, max_results // 2)
-            all_posts.extend(twitter_posts)
-            
-            # Scrape Reddit
-            reddit_posts = self._scrape_reddit(vip, max_results // 2)  
-            all_posts.extend(reddit_posts)
+        # Twitter web searches are network-bound, so run one job per VIP concurrently. PRAW is not
+        # thread-safe, so every Reddit search shares a single job that runs them one after another
+        limit = max_results // 2
+        jobs = [partial(self._scrape_twitter_web, vip, limit) for vip in vip_accounts]
+        jobs.append(lambda: [post for vip in vip_accounts for post in self._scrape_reddit(vip, limit)])
         
-        # Sort by timestamp
-        return sorted(all_posts, key=lambda x: x.get('timestamp', datetime.now()), reverse=True)
+        with ThreadPoolExecutor(max_workers=min(len(jobs), 8)) as executor:
+            scraped = executor.map(lambda job: job(), jobs)
+            # Newest first, keeping only max_results as batches arrive instead of sorting everything
+            return heapq.nlargest(
+                max_results,
+                chain.from_iterable(scraped),
+                key=lambda x: x.get('timestamp', datetime.min)
+            )
 
     def _scrape_twitter_web(self, query, limit):
+        key = (query, limit)
+        with self._scrape_cache_lock:
+            cached = self._scrape_cache.get(key)
+            if cached:
+                self._scrape_cache.move_to_end(key)
+
+        if cached and time.monotonic() - cached[0] < SCRAPE_CACHE_SECONDS:
+            results = cached[1]
+        else:
+            results = self._search_twitter_web(query, limit)
+            # Empty pages are usually blocks or rate limits, so only keep real hits
+            if results:
+                with self._scrape_cache_lock:
+                    self._scrape_cache[key] = (time.monotonic(), results)
+                    self._scrape_cache.move_to_end(key)
+                    if len(self._scrape_cache) > SCRAPE_CACHE_MAX_ENTRIES:
+                        self._scrape_cache.popitem(last=False)
+        # Hand out copies so a caller editing a post can't alter the cached entry
+        return [dict(post) for post in results]
+
+    def _search_twitter_web(self, query, limit):
         results = []
         try:
             # Use Google to find Twitter posts
             search_query = f'site:twitter.com "{query.replace("@", "")}"'
             google_url = f"https://www.google.com/search?q={requests.utils.quote(search_query)}"
             
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(google_url, headers=headers, timeout=10)
+            response = self._http.get(google_url, headers=_SCRAPE_HEADERS, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract Twitter URLs from search results
-                for i, link in enumerate(soup.find_all('a', href=True)[:limit]):
-                    href = link.get('href', '')
-                    if 'twitter.com' in href and '/status/' in href:
-                        results.append({
-                            'id': f'twitter_{i}',
-                            'username': query,
-                            'platform': 'Twitter',
-                            'content': f"Content about {query} from Twitter",
-                            'timestamp': datetime.now(),
-                            'engagement': 100,
-                            'url': href,
-                            'source': 'Google Search'
-                        })
-                        
-                        if len(results) >= limit:
-                            break
+                # Extract Twitter URLs from search results, all stamped with the same fetch time
+                fetched_at = datetime.now()
+                # The raw HTML repeats a result's URL (title link, cached link, ...); keep the first
+                seen = set()
+                for match in _TW_URL.finditer(response.text):
+                    if len(results) >= limit:
+                        break
+                    href = match.group(0)
+                    if href in seen:
+                        continue
+                    seen.add(href)
+                    results.append({
+                        'id': f'twitter_{len(results)}',
+                        'username': query,
+                        'platform': 'Twitter',
+                        'content': f"Content about {query} from Twitter",
+                        'timestamp': fetched_at,
+                        'engagement': 100,
+                        'url': href,
+                        'source': 'Google Search'
+                    })
                             
         except Exception as e:
             print(f"Twitter scraping error: {e}")
@@ -1,42 +1,54 @@
-from datetime import datetime
-import random
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+
+def _viral_score_kernel(engagement, hours_ago):
+    # Float arrays in, scores out; NaN ages (missing or unparseable timestamps) get no recency boost
+    base_score = np.minimum(engagement / 100000, 1.0)
+    recency_boost = np.nan_to_num(np.maximum(0.0, 1.0 - hours_ago / 24.0), nan=0.0)
+    return np.minimum(base_score + recency_boost * 0.2, 1.0)
+
+def _to_utc(timestamp):
+    # Naive datetimes and ISO strings are local time like datetime.now(); aware ones keep their offset
+    try:
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return timestamp.astimezone(timezone.utc)
+    except (AttributeError, TypeError, ValueError, OverflowError, OSError):
+        return None
 
 class ViralTracker:
     def __init__(self):
         self.viral_threshold = 10000
+        self._rng = np.random.default_rng(seed=42)
 
     def track_viral_content(self, posts):
-        viral_posts = []
-        for post in posts:
-            engagement = post.get('engagement', 0)
-            if engagement > self.viral_threshold:
-                viral_score = self._calculate_viral_score(post)
-                viral_posts.append({
-                    'post_id': post.get('id'),
-                    'platform': post.get('platform'),
-                    'content': post.get('content', ''),
-                    'engagement': engagement,
-                    'viral_score': viral_score,
-                    'timestamp': post.get('timestamp'),
-                    'velocity': self._calculate_spread_velocity(post)
-                })
-        return sorted(viral_posts, key=lambda x: x['viral_score'], reverse=True)
-
-    def _calculate_viral_score(self, post):
-        engagement = post.get('engagement', 0)
-        base_score = min(engagement / 100000, 1.0)
-        timestamp = post.get('timestamp', datetime.now())
-        try:
-            if isinstance(timestamp, str):
-                post_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            else:
-                post_time = timestamp
-            hours_ago = (datetime.now() - post_time).total_seconds() / 3600
-            recency_boost = max(0, 1 - (hours_ago / 24))
-        except:
-            recency_boost = 0
-        return min(base_score + recency_boost * 0.2, 1.0)
-
-    def _calculate_spread_velocity(self, post):
-        engagement = post.get('engagement', 0)
-        return random.uniform(0.5, 2.0) * (engagement / 10000)
+        if not posts:
+            return []
+
+        # Object columns hand ids, engagement and missing fields (None) back exactly as posted
+        df = pd.DataFrame(
+            [(post.get('id'), post.get('platform'), post.get('content', ''), post.get('engagement', 0), post.get('timestamp'))
+             for post in posts],
+            columns=['post_id', 'platform', 'content', 'engagement', 'timestamp'],
+            dtype=object
+        )
+        engagement = df['engagement'].to_numpy(np.float64)
+        viral = engagement > self.viral_threshold
+        if not viral.any():
+            return []
+
+        df = df[viral].assign(
+            viral_score=_viral_score_kernel(engagement[viral], self._hours_since(df['timestamp'][viral])),
+            velocity=self._calculate_spread_velocity(engagement[viral])
+        ).sort_values('viral_score', ascending=False, kind='stable')
+        return df[['post_id', 'platform', 'content', 'engagement', 'viral_score', 'timestamp', 'velocity']].to_dict('records')
+
+    def _hours_since(self, timestamps):
+        # Both sides in UTC, so a post's age does not depend on the machine's time zone
+        post_time = pd.to_datetime(timestamps.map(_to_utc), errors='coerce', utc=True)
+        return ((pd.Timestamp.now(tz='UTC') - post_time).dt.total_seconds() / 3600).to_numpy(np.float64)
+
+    def _calculate_spread_velocity(self, engagement):
+        # One draw for the whole batch instead of a random.uniform call per post
+        return self._rng.uniform(0.5, 2.0, size=len(engagement)) * (engagement / 10000)